@@ -190,8 +190,7 @@ async function manageList(type, title, renderFilterCategoriesMultiSelectCallback
         } else if (type === 'statuses') {
           // Check if status is used by tasks OR milestones
           const tasksUse = allTasks.some(task => task.status === itemToRemove);
-          const allMilestones = await Promise.all(allTasks.map(t => DB.getMilestonesForTask(t.id))).then(arr => arr.flat());
-          const milestonesUse = allMilestones.some(m => m.status === itemToRemove);
+          const milestonesUse = await DB.isStatusUsedByMilestones(itemToRemove);
 
           if (tasksUse || milestonesUse) {
             showModalAlert(`Cannot delete status "${itemToRemove}" because it is currently in use by one or more tasks or milestones.`);
@@ -260,13 +259,16 @@ async function manageList(type, title, renderFilterCategoriesMultiSelectCallback
         finalUpdateList = defaultList;
       }
 
+      // Meta entries to persist together in one transaction
+      const metaUpdates = { [putMetaKey]: finalUpdateList };
+
       // Update the main categories/statuses/froms array
       if (type === 'categories') {
         categories = finalUpdateList;
         // Also update selectedFilterCategories if a category was removed
         let selectedFilterCategories = (await DB.getMeta('selectedFilterCategories')) || [];
         selectedFilterCategories = selectedFilterCategories.filter(cat => categories.includes(cat));
-        await DB.putMeta('selectedFilterCategories', selectedFilterCategories);
+        metaUpdates.selectedFilterCategories = selectedFilterCategories;
         if (renderFilterCategoriesMultiSelectCallback) renderFilterCategoriesMultiSelectCallback(); // Re-render the multi-select filter
         if (updateLeftMenuTaskUICallback) updateLeftMenuTaskUICallback({ categories: finalUpdateList, selectedFilterCategories: selectedFilterCategories });
         if (updateTaskEditorUICallback) updateTaskEditorUICallback({ categories: finalUpdateList });
@@ -281,7 +283,7 @@ async function manageList(type, title, renderFilterCategoriesMultiSelectCallback
         if (updateLeftMenuTaskUICallback) updateLeftMenuTaskUICallback({ froms: finalUpdateList });
         if (updateTaskEditorUICallback) updateTaskEditorUICallback({ froms: finalUpdateList });
       }
-      await DB.putMeta(putMetaKey, finalUpdateList);
+      await DB.putMetas(metaUpdates);
       if (renderTaskListCallback) await renderTaskListCallback(); // Re-render task list to reflect changes
     }
   });
@@ -320,12 +322,15 @@ async function clearAllData() {
  */
 async function exportJSON() {
   const allTasks = await DB.getAllTasks();
-  
-  // Fetch all milestones and attach them to their respective tasks
-  const tasksWithMilestones = await Promise.all(allTasks.map(async (task) => {
-    const milestones = await DB.getMilestonesForTask(task.id);
-    return { ...task, milestones: milestones };
-  }));
+  const allMilestones = await DB.getAllMilestones();
+
+  // Group all milestones by task in one pass and attach them to their respective tasks
+  const milestonesByTask = new Map();
+  allMilestones.forEach(m => {
+    if (!milestonesByTask.has(m.taskId)) milestonesByTask.set(m.taskId, []);
+    milestonesByTask.get(m.taskId).push(m);
+  });
+  const tasksWithMilestones = allTasks.map(task => ({ ...task, milestones: milestonesByTask.get(task.id) || [] }));
 
   const data = {
       tasks: tasksWithMilestones, // Include tasks with nested milestones
@@ -373,22 +378,18 @@ async function importJSON(e) {
     }
     
     if (j.tasks) {
+      const milestonesToImport = [];
       for (const t of j.tasks) {
-        // Temporarily extract milestones if they exist
-        const milestonesToImport = t.milestones || [];
+        // Extract milestones if they exist
+        if (t.milestones) milestonesToImport.push(...t.milestones);
         // Remove milestones property from task before saving the task itself
-        delete t.milestones; 
-        await DB.putTask(t);
-
-        // Save associated milestones
-        for (const m of milestonesToImport) {
-          await DB.putMilestone(m);
-        }
+        delete t.milestones;
       }
+      // Save all tasks, then all associated milestones, one transaction each
+      await DB.putTasks(j.tasks);
+      await DB.putMilestones(milestonesToImport);
     }
-    await DB.putMeta('categories', categories);
-    await DB.putMeta('statuses', statuses);
-    await DB.putMeta('froms', froms);
+    await DB.putMetas({ categories, statuses, froms });
     
     // Call callbacks provided by the main UI module
     if (renderTaskListCallback) await renderTaskListCallback();
@@ -44,6 +44,85 @@ const selectors = {
   filterColumn: '#filterColumn',
 };
 
+/**
+ * Compares two optional string values, placing null/empty values at the end.
+ * @param {string|null} a - First value.
+ * @param {string|null} b - Second value.
+ * @param {boolean} [descending=false] - Whether non-empty values sort descending.
+ * @returns {number} The sort order.
+ */
+function compareEmptyLast(a, b, descending = false) {
+  if (!a && !b) return 0;
+  if (!a) return 1; // a is empty, b is not, so a comes after b
+  if (!b) return -1; // b is empty, a is not, so a comes before b
+  return descending ? b.localeCompare(a) : a.localeCompare(b);
+}
+
+// Task comparators keyed by the "Sort by" value
+const taskComparators = {
+  deadline: (a, b) => compareEmptyLast(a.deadline, b.deadline),
+  priority: (a, b) => a.priority - b.priority,
+  from: (a, b) => compareEmptyLast(a.from, b.from),
+  // Default: sort by updated at descending
+  updatedAt: (a, b) => compareEmptyLast(a.updatedAt, b.updatedAt, true),
+};
+
+/**
+ * Converts a date range filter's input values into timestamps.
+ * The end of the range is moved to the next day's 00:00:00 so the full 'to' day is included.
+ * @param {string} fromDateStr - The 'from' input value (may be empty).
+ * @param {string} toDateStr - The 'to' input value (may be empty).
+ * @returns {{from: number|null, to: number|null}|null} The range, or null if neither bound is set.
+ */
+function parseDateRange(fromDateStr, toDateStr) {
+  if (!fromDateStr && !toDateStr) return null;
+  let to = null;
+  if (toDateStr) {
+    const toDate = new Date(toDateStr);
+    toDate.setDate(toDate.getDate() + 1);
+    to = toDate.getTime();
+  }
+  return { from: fromDateStr ? Date.parse(fromDateStr) : null, to };
+}
+
+/**
+ * Checks whether a task date falls within a range from parseDateRange.
+ * @param {string|null} taskDateStr - The task's date value.
+ * @param {{from: number|null, to: number|null}} range - The parsed range.
+ * @returns {boolean} False if the date is missing or outside the range.
+ */
+function isInDateRange(taskDateStr, range) {
+  if (!taskDateStr) return false;
+  const taskTime = Date.parse(taskDateStr);
+  if (range.from !== null && taskTime < range.from) return false;
+  if (range.to !== null && taskTime >= range.to) return false;
+  return true;
+}
+
+// Shared formatter for "Month Year" group labels, created once
+const monthYearFormat = new Intl.DateTimeFormat('en-US', { year: 'numeric', month: 'long' });
+
+// Formats a date value as a "Month Year" label. format() throws on an invalid
+// date, so keep the "Invalid Date" label toLocaleDateString() produced.
+function formatMonthYear(value) {
+  const d = new Date(value);
+  return isNaN(d) ? 'Invalid Date' : monthYearFormat.format(d);
+}
+
+// Group key functions keyed by the "Group by" value. Category grouping is
+// handled separately since a task can belong to several categories.
+const taskGroupKeys = {
+  from: task => task.from || 'No From',
+  status: task => task.status || 'No Status',
+  priority: task => task.priority ? `Priority ${task.priority}` : "No Priority",
+  deadlineYear: task => task.deadline ? new Date(task.deadline).getFullYear().toString() : 'No Deadline',
+  deadlineMonthYear: task => task.deadline ? formatMonthYear(task.deadline) : 'No Deadline',
+  finishDateYear: task => task.finishDate ? new Date(task.finishDate).getFullYear().toString() : 'No Finish Date',
+  finishDateMonthYear: task => task.finishDate ? formatMonthYear(task.finishDate) : 'No Finish Date',
+  createdAtYear: task => task.createdAt ? new Date(task.createdAt).getFullYear().toString() : 'No Creation Date',
+  createdAtMonthYear: task => task.createdAt ? formatMonthYear(task.createdAt) : 'No Creation Date',
+};
+
 /**
  * Initializes left menu task UI event listeners and state.
  * @param {object} initialState - Object containing initial categories, statuses, filter states.
@@ -192,12 +271,13 @@ export function updateLeftMenuTaskUIState(updatedState) {
 export async function renderTaskList() {
   const container = document.querySelector(selectors.taskList);
   if (!container) return; // Ensure container exists
-  container.innerHTML = ''; // Clear existing tasks to prevent duplication
   const tasks = await DB.getAllTasks();
   const q = document.querySelector(selectors.searchInput)?.value.toLowerCase() || '';
   // Removed old filterStat variable as it's replaced by selectedFilterStatuses
 
   const sortVal = document.querySelector(selectors.sortBy)?.value || 'updatedAt';
+  // Resolve the comparator once instead of re-checking sortVal on every comparison
+  const compareTasks = taskComparators[sortVal] || taskComparators.updatedAt;
   const groupVal = document.querySelector(selectors.groupBy)?.value || '__none';
 
   // Get values for all new date range filters
@@ -210,6 +290,18 @@ export async function renderTaskList() {
   const finishedRF = document.querySelector(selectors.finishedRangeFrom)?.value;
   const finishedRT = document.querySelector(selectors.finishedRangeTo)?.value;
 
+  // Parse the active date ranges once per render instead of once per task
+  const activeDateRanges = [
+    ['createdAt', parseDateRange(createdRF, createdRT)],
+    ['updatedAt', parseDateRange(updatedRF, updatedRT)],
+    ['deadline', parseDateRange(deadlineRF, deadlineRT)],
+    ['finishDate', parseDateRange(finishedRF, finishedRT)],
+  ].filter(([, range]) => range);
+
+  // Build lookup sets once per render rather than scanning the selection arrays per task
+  const selectedCategorySet = new Set(selectedFilterCategories);
+  const selectedStatusSet = new Set(selectedFilterStatuses);
+
   let filtered = tasks.filter(t => {
     // Search filter
     if (q && !(t.title?.toLowerCase().includes(q) || t.from?.toLowerCase().includes(q) || t.notes?.toLowerCase().includes(q) || t.description?.toLowerCase().includes(q))) return false;
@@ -217,78 +309,38 @@ export async function renderTaskList() {
     // Category filter (multi-select)
     // If selectedFilterCategories is empty, it means "select all" (no filter applied)
     if (selectedFilterCategories.length > 0) {
-        const taskHasSelectedCategory = t.categories?.some(cat => selectedFilterCategories.includes(cat));
+        const taskHasSelectedCategory = t.categories?.some(cat => selectedCategorySet.has(cat));
         if (!taskHasSelectedCategory) return false;
     }
 
     // Status filter (multi-select)
     // If selectedFilterStatuses is empty, it means "select all" (no filter applied)
     if (selectedFilterStatuses.length > 0) {
-        if (!selectedFilterStatuses.includes(t.status)) return false;
+        if (!selectedStatusSet.has(t.status)) return false;
     }
     
-    // Date filters (adjusting endDate to include the whole day)
-    const checkDateRange = (taskDateStr, fromDateStr, toDateStr) => {
-      if (!taskDateStr) return false;
-      const taskDate = new Date(taskDateStr);
-      if (fromDateStr && taskDate < new Date(fromDateStr)) return false;
-      if (toDateStr) {
-        const toDate = new Date(toDateStr);
-        toDate.setDate(toDate.getDate() + 1); // Set to next day 00:00:00 to include the full 'to' day
-        if (taskDate >= toDate) return false;
-      }
-      return true;
-    };
-
-    if ((createdRF || createdRT) && !checkDateRange(t.createdAt, createdRF, createdRT)) return false;
-    if ((updatedRF || updatedRT) && !checkDateRange(t.updatedAt, updatedRF, updatedRT)) return false;
-    if ((deadlineRF || deadlineRT) && !checkDateRange(t.deadline, deadlineRF, deadlineRT)) return false;
-    // For finishDate, specifically handle null values for unfinished tasks
-    if ((finishedRF || finishedRT)) {
-      if (!t.finishDate || !checkDateRange(t.finishDate, finishedRF, finishedRT)) return false;
+    // Date filters; tasks without a value for a filtered date (e.g. unfinished tasks) are excluded
+    for (const [field, range] of activeDateRanges) {
+      if (!isInDateRange(t[field], range)) return false;
     }
 
     return true;
   });
 
+  // Build the list off-DOM and swap it in once, so the container is laid out a single time
+  // and overlapping renders cannot append duplicate items after an await
+  const list = document.createDocumentFragment();
+
   // Grouping logic
   if (groupVal === '__none') {
       // No grouping, just sort and render
-      filtered.sort((a, b) => {
-          if (sortVal === 'deadline') {
-            // Sort deadline: null/empty to the end
-            const deadlineA = a.deadline || null;
-            const deadlineB = b.deadline || null;
-
-            if (deadlineA === null && deadlineB === null) return 0;
-            if (deadlineA === null) return 1; // a is null, b is not, so a comes after b
-            if (deadlineB === null) return -1; // b is null, a is not, so a comes before b
-            return deadlineA.localeCompare(deadlineB);
-          }
-          if (sortVal === 'priority') return a.priority - b.priority;
-          if (sortVal === 'from') {
-            // Sort from: null/empty to the end
-            const fromA = a.from || null;
-            const fromB = b.from || null;
-
-            if (fromA === null && fromB === null) return 0;
-            if (fromA === null) return 1;
-            if (fromB === null) return -1;
-            return fromA.localeCompare(fromB);
-          }
-          // Default sort by updated at descending, null/empty to the end
-          const updatedAtA = a.updatedAt || null;
-          const updatedAtB = b.updatedAt || null;
-
-          if (updatedAtA === null && updatedAtB === null) return 0;
-          if (updatedAtA === null) return 1;
-          if (updatedAtB === null) return -1;
-          return updatedAtB.localeCompare(updatedAtA);
-      });
-      renderTaskItems(container, filtered);
+      filtered.sort(compareTasks);
+      renderTaskItems(list, filtered);
   } else {
       const groupedTasks = {};
-      
+      // Resolve the group key function once instead of switching on groupVal per task
+      const getGroupKey = taskGroupKeys[groupVal] || (() => 'No Group');
+
       filtered.forEach(task => {
           if (groupVal === 'category' && task.categories && task.categories.length > 0) {
               // If grouping by category and task has multiple categories, add to each group
@@ -303,38 +355,7 @@ export async function renderTaskList() {
                   }
               });
           } else {
-              let groupKey;
-              switch (groupVal) {
-                  case 'from':
-                      groupKey = task.from || 'No From';
-                      break;
-                  case 'status':
-                      groupKey = task.status || 'No Status';
-                      break;
-                  case 'priority':
-                      groupKey = task.priority ? `Priority ${task.priority}` : "No Priority";
-                      break;
-                  case 'deadlineYear':
-                      groupKey = task.deadline ? new Date(task.deadline).getFullYear().toString() : 'No Deadline';
-                      break;
-                  case 'deadlineMonthYear':
-                      groupKey = task.deadline ? new Date(task.deadline).toLocaleDateString('en-US', { year: 'numeric', month: 'long' }) : 'No Deadline';
-                      break;
-                  case 'finishDateYear':
-                      groupKey = task.finishDate ? new Date(task.finishDate).getFullYear().toString() : 'No Finish Date';
-                      break;
-                  case 'finishDateMonthYear':
-                      groupKey = task.finishDate ? new Date(task.finishDate).toLocaleDateString('en-US', { year: 'numeric', month: 'long' }) : 'No Finish Date';
-                      break;
-                  case 'createdAtYear':
-                      groupKey = task.createdAt ? new Date(task.createdAt).getFullYear().toString() : 'No Creation Date';
-                      break;
-                  case 'createdAtMonthYear':
-                      groupKey = task.createdAt ? new Date(task.createdAt).toLocaleDateString('en-US', { year: 'numeric', month: 'long' }) : 'No Creation Date';
-                      break;
-                  default:
-                      groupKey = 'No Group';
-              }
+              const groupKey = getGroupKey(task);
 
               if (!groupedTasks[groupKey]) {
                   groupedTasks[groupKey] = [];
@@ -379,8 +400,8 @@ export async function renderTaskList() {
           const groupContentDiv = document.createElement('div');
           groupContentDiv.className = 'group-content show'; // Initially show content
 
-          container.appendChild(groupHeaderDiv);
-          container.appendChild(groupContentDiv);
+          list.appendChild(groupHeaderDiv);
+          list.appendChild(groupContentDiv);
 
           // Add event listener to toggle content visibility
           groupHeaderDiv.querySelector('.toggle-group-btn')?.addEventListener('click', (e) => {
@@ -393,51 +414,25 @@ export async function renderTaskList() {
           });
 
           // Sort tasks within each group
-          groupedTasks[groupKey].sort((a, b) => {
-              if (sortVal === 'deadline') {
-                const deadlineA = a.deadline || null;
-                const deadlineB = b.deadline || null;
-
-                if (deadlineA === null && deadlineB === null) return 0;
-                if (deadlineA === null) return 1;
-                if (deadlineB === null) return -1;
-                return deadlineA.localeCompare(deadlineB);
-              }
-              if (sortVal === 'priority') return a.priority - b.priority;
-              if (sortVal === 'from') {
-                const fromA = a.from || null;
-                const fromB = b.from || null;
-
-                if (fromA === null && fromB === null) return 0;
-                if (fromA === null) return 1;
-                if (fromB === null) return -1;
-                return fromA.localeCompare(fromB);
-              }
-              // Default sort by updatedAt descending, null/empty to the end
-              const updatedAtA = a.updatedAt || null;
-              const updatedAtB = b.updatedAt || null;
-
-              if (updatedAtA === null && updatedAtB === null) return 0;
-              if (updatedAtA === null) return 1;
-              if (updatedAtB === null) return -1;
-              return updatedAtB.localeCompare(updatedAtA);
-          });
+          groupedTasks[groupKey].sort(compareTasks);
 
           renderTaskItems(groupContentDiv, groupedTasks[groupKey]);
       });
   }
+
+  container.replaceChildren(list);
 }
 
 /**
  * Renders individual task items into a container.
- * @param {HTMLElement} container - The DOM element to render tasks into.
+ * @param {HTMLElement|DocumentFragment} container - The node to render tasks into.
  * @param {Array<object>} tasksToRender - Array of task objects to render.
  */
 function renderTaskItems(container, tasksToRender) {
   const tmpl = document.getElementById('task-item-template')?.content;
   if (!tmpl) return; // Ensure template exists
 
-  // The container.innerHTML = ''; is handled by renderTaskList()
+  // The container is replaced wholesale by renderTaskList()
   // No need to clear here again as this function is called by renderTaskList()
 
   tasksToRender.forEach(t => {
@@ -182,10 +182,7 @@ async function deleteMilestone() {
   }
 
   // Before deleting, check if this milestone is a parent to any other milestones
-  const allMilestones = await DB.getMilestonesForTask(currentTaskId);
-  const childrenMilestones = allMilestones.filter(m => m.parentId === currentMilestone.id);
-
-  if (childrenMilestones.length > 0) {
+  if (await DB.hasChildMilestones(currentMilestone.id)) {
       showModalAlert(`Cannot delete milestone "${escapeHtml(currentMilestone.title)}" because it is a parent to other milestones. Please remove its children's parent link first.`);
       return;
   }
@@ -176,7 +176,7 @@ export async function renderMilestoneBubbles(taskId, containerEl) {
   const queue = [];
 
   // Sort root milestones for consistent initial horizontal ordering
-  rootMilestones.sort((a, b) => new Date(a.createdAt).getTime() - new Date(b.createdAt).getTime());
+  rootMilestones.sort((a, b) => Date.parse(a.createdAt) - Date.parse(b.createdAt));
 
   // Initialize queue with roots and assign them level 0
   rootMilestones.forEach(m => {
@@ -195,7 +195,7 @@ export async function renderMilestoneBubbles(taskId, containerEl) {
 
     const children = childrenMap.get(currentId) || [];
     // Sort children for consistent horizontal ordering within a parent's group
-    children.sort((a, b) => new Date(a.createdAt).getTime() - new Date(b.createdAt).getTime());
+    children.sort((a, b) => Date.parse(a.createdAt) - Date.parse(b.createdAt));
 
     children.forEach(child => {
       // Only process if child hasn't been assigned a level yet (prevents infinite loops for cycles)
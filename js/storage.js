@@ -4,13 +4,31 @@ export const DB = (function(){
   const STORE_META = 'meta';
   // New store for milestones
   const STORE_MILESTONES = 'milestones'; 
+  // Write transactions don't wait for an OS-level flush before completing.
+  // Browsers without durability hints ignore this argument.
+  const WRITE_OPTS = {durability:'relaxed'};
   let db;
+  // Pending open request, shared so concurrent callers reuse one connection
+  let opening = null;
+  // Tells other tabs sharing this database which stores a committed write touched,
+  // so they can drop their caches. Without it, results are not cached at all.
+  const channel = typeof BroadcastChannel !== 'undefined' ? new BroadcastChannel(DB_NAME) : null;
+  // Result of the last getAllTasks(), dropped whenever the task store is written
+  // here or in another tab.
+  // tasksVersion lets a read that raced with a write skip caching stale data.
+  let tasksCache = null;
+  let tasksVersion = 0;
+  // Per-task results of getMilestonesForTask(), dropped on any milestone-store write,
+  // here or in another tab
+  const milestonesCache = new Map();
+  let milestonesVersion = 0;
 
   function open(){
-    return new Promise((resolve,reject)=>{
-      if(db) return resolve(db);
-      // Version bump to 4 to trigger onupgradeneeded for milestones
-      const r = indexedDB.open(DB_NAME, 4); 
+    if(db) return Promise.resolve(db);
+    if(opening) return opening;
+    opening = new Promise((resolve,reject)=>{
+      // Version bump to 6 to trigger onupgradeneeded for the milestone status index
+      const r = indexedDB.open(DB_NAME, 6); 
       r.onupgradeneeded = e => {
         const idb = e.target.result;
         
@@ -32,152 +50,228 @@ export const DB = (function(){
         }
 
         // New Milestone store (for version 4)
+        let mstore;
         if(!idb.objectStoreNames.contains(STORE_MILESTONES)){
-          const mstore = idb.createObjectStore(STORE_MILESTONES,{keyPath:'id'});
+          mstore = idb.createObjectStore(STORE_MILESTONES,{keyPath:'id'});
           // Index to quickly retrieve milestones by their parent task ID
           mstore.createIndex('taskId','taskId',{unique:false});
           mstore.createIndex('deadline','deadline',{unique:false});
           mstore.createIndex('finishDate','finishDate',{unique:false});
+        } else {
+          mstore = r.transaction.objectStore(STORE_MILESTONES);
         }
+        // Index to look up child milestones by their parent milestone ID (version 5)
+        if(!mstore.indexNames.contains('parentId')) mstore.createIndex('parentId','parentId',{unique:false});
+        // Index to check whether a status is used by any milestone (version 6)
+        if(!mstore.indexNames.contains('status')) mstore.createIndex('status','status',{unique:false});
+      };
+      r.onsuccess = e => {
+        db = e.target.result;
+        // Release the long-lived connection when another tab upgrades or deletes
+        // the database, so that tab isn't blocked; the next call reopens it.
+        db.onversionchange = () => close();
+        opening = null;
+        resolve(db);
       };
-      r.onsuccess = e => { db = e.target.result; resolve(db); };
-      r.onerror = e => reject(e.target.error);
+      r.onerror = e => { opening = null; reject(e.target.error); };
     });
+    return opening;
   }
 
-  // --- Task Operations (Existing) ---
-  async function putTask(task){
-    const connection = await open();
-    return new Promise((resolve,reject)=>{
-      const tx = connection.transaction([STORE_TASKS],'readwrite');
-      const store = tx.objectStore(STORE_TASKS);
-      store.put(task);
-      tx.oncomplete = ()=>resolve(task);
-      tx.onerror = e => reject(e.target.error);
-    });
+  function invalidateTasks(){
+    tasksCache = null;
+    tasksVersion++;
+  }
+
+  function invalidateMilestones(){
+    milestonesCache.clear();
+    milestonesVersion++;
+  }
+
+  if(channel){
+    channel.onmessage = e => {
+      if(e.data.includes(STORE_TASKS)) invalidateTasks();
+      if(e.data.includes(STORE_MILESTONES)) invalidateMilestones();
+    };
   }
 
-  async function getTask(id){
+  // Runs reads(store) in one readonly transaction and, once it completes, resolves with
+  // the returned request's result, or with the returned value when it issues several requests
+  async function read(storeName, reads){
     const conn = await open();
     return new Promise((res,rej)=>{
-      const tx = conn.transaction([STORE_TASKS],'readonly');
-      tx.objectStore(STORE_TASKS).get(id).onsuccess = e => res(e.target.result);
+      const tx = conn.transaction([storeName],'readonly');
+      const result = reads(tx.objectStore(storeName));
+      tx.oncomplete = ()=>res(result instanceof IDBRequest ? result.result : result);
       tx.onerror = e => rej(e.target.error);
     });
   }
 
-  async function deleteTask(id){
+  // Runs writes(tx) in one readwrite transaction and resolves with its return value once committed.
+  // If writes(tx) throws (e.g. put() of a record without a key), the whole transaction is aborted.
+  async function write(storeNames, writes){
     const conn = await open();
-    return new Promise(async (res,rej)=>{
-      const tx = conn.transaction([STORE_TASKS, STORE_MILESTONES],'readwrite');
-      
+    return new Promise((res,rej)=>{
+      const tx = conn.transaction(storeNames,'readwrite',WRITE_OPTS);
+      let result;
+      try {
+        result = writes(tx);
+      } catch(err) {
+        tx.abort();
+        rej(err);
+        return;
+      }
+      tx.oncomplete = ()=>{
+        channel?.postMessage(storeNames);
+        res(result);
+      };
+      tx.onerror = e => rej(e.target.error);
+    });
+  }
+
+  // --- Task Operations (Existing) ---
+  function putTask(task){
+    return write([STORE_TASKS], tx => {
+      invalidateTasks();
+      tx.objectStore(STORE_TASKS).put(task);
+      return task;
+    });
+  }
+
+  // Saves many tasks in a single transaction (used by import)
+  function putTasks(tasks){
+    return write([STORE_TASKS], tx => {
+      invalidateTasks();
+      const store = tx.objectStore(STORE_TASKS);
+      tasks.forEach(t => store.put(t));
+      return tasks;
+    });
+  }
+
+  function getTask(id){
+    return read(STORE_TASKS, store => store.get(id));
+  }
+
+  function deleteTask(id){
+    return write([STORE_TASKS, STORE_MILESTONES], tx => {
+      invalidateTasks();
+      invalidateMilestones();
+
       // Delete task itself
       tx.objectStore(STORE_TASKS).delete(id);
 
-      // Delete all associated milestones
+      // Delete all associated milestones. A key cursor walks only the index keys,
+      // so milestone records are never read just to be deleted.
       const milestoneStore = tx.objectStore(STORE_MILESTONES);
       const taskIdIndex = milestoneStore.index('taskId');
-      const request = taskIdIndex.openCursor(IDBKeyRange.only(id));
+      const request = taskIdIndex.openKeyCursor(IDBKeyRange.only(id));
 
       request.onsuccess = (e) => {
         const cursor = e.target.result;
         if (cursor) {
-          cursor.delete(); // Delete the current milestone
+          milestoneStore.delete(cursor.primaryKey); // Delete the current milestone
           cursor.continue(); // Move to the next
         }
       };
       request.onerror = (e) => {
         console.error("Error deleting associated milestones:", e.target.error);
       };
-
-      tx.oncomplete = ()=>res();
-      tx.onerror = e => rej(e.target.error);
     });
   }
 
+  // Returns a shared, cached array; callers must not modify it in place
   async function getAllTasks(){
-    const conn = await open();
-    return new Promise((res,rej)=>{
-      const tx = conn.transaction([STORE_TASKS],'readonly');
-      const out = [];
-      const cursor = tx.objectStore(STORE_TASKS).openCursor();
-      cursor.onsuccess = e => {
-        const cur = e.target.result;
-        if(cur){ out.push(cur.value); cur.continue(); } else { res(out); }
-      };
-      cursor.onerror = e => rej(e.target.error);
-    });
+    if(tasksCache) return tasksCache;
+    const version = tasksVersion;
+    const out = await read(STORE_TASKS, store => store.getAll());
+    if(channel && version === tasksVersion) tasksCache = out;
+    return out;
   }
 
   // --- Meta Operations (Existing) ---
-  async function putMeta(key,value){
-    const conn = await open();
-    return new Promise((res,rej)=>{
-      const tx = conn.transaction([STORE_META],'readwrite');
-      tx.objectStore(STORE_META).put({key,value});
-      tx.oncomplete = ()=>res();
-      tx.onerror = e => rej(e.target.error);
+  function putMeta(key,value){
+    return write([STORE_META], tx => { tx.objectStore(STORE_META).put({key,value}); });
+  }
+
+  // Saves several meta entries ({key: value, ...}) in a single transaction
+  function putMetas(entries){
+    return write([STORE_META], tx => {
+      const store = tx.objectStore(STORE_META);
+      Object.entries(entries).forEach(([key,value]) => store.put({key,value}));
     });
   }
 
   async function getMeta(key){
-    const conn = await open();
-    return new Promise((res,rej)=>{
-      const tx = conn.transaction([STORE_META],'readonly');
-      tx.objectStore(STORE_META).get(key).onsuccess = e => res(e.target.result?.value);
-      tx.onerror = e => rej(e.target.error);
+    const entry = await read(STORE_META, store => store.get(key));
+    return entry?.value;
+  }
+
+  // Reads several meta entries in a single transaction, resolving with {key: value, ...}
+  function getMetas(keys){
+    return read(STORE_META, store => {
+      const values = {};
+      keys.forEach(key => {
+        store.get(key).onsuccess = e => { values[key] = e.target.result?.value; };
+      });
+      return values;
     });
   }
 
   // --- New Milestone Operations ---
-  async function putMilestone(milestone){
-    const connection = await open();
-    return new Promise((resolve,reject)=>{
-      const tx = connection.transaction([STORE_MILESTONES],'readwrite');
-      const store = tx.objectStore(STORE_MILESTONES);
-      store.put(milestone);
-      tx.oncomplete = ()=>resolve(milestone);
-      tx.onerror = e => reject(e.target.error);
+  function putMilestone(milestone){
+    return write([STORE_MILESTONES], tx => {
+      invalidateMilestones();
+      tx.objectStore(STORE_MILESTONES).put(milestone);
+      return milestone;
     });
   }
 
-  async function getMilestone(id){
-    const conn = await open();
-    return new Promise((res,rej)=>{
-      const tx = conn.transaction([STORE_MILESTONES],'readonly');
-      tx.objectStore(STORE_MILESTONES).get(id).onsuccess = e => res(e.target.result);
-      tx.onerror = e => rej(e.target.error);
+  // Saves many milestones in a single transaction (used by import)
+  function putMilestones(milestones){
+    return write([STORE_MILESTONES], tx => {
+      invalidateMilestones();
+      const store = tx.objectStore(STORE_MILESTONES);
+      milestones.forEach(m => store.put(m));
+      return milestones;
     });
   }
 
+  function getMilestone(id){
+    return read(STORE_MILESTONES, store => store.get(id));
+  }
+
+  // Fetches all of a task's milestones in one request via the taskId index.
+  // Returns a shared, cached array; callers must not modify it in place
   async function getMilestonesForTask(taskId){
-    const conn = await open();
-    return new Promise((res,rej)=>{
-      const tx = conn.transaction([STORE_MILESTONES],'readonly');
-      const milestoneStore = tx.objectStore(STORE_MILESTONES);
-      const taskIdIndex = milestoneStore.index('taskId');
-      const out = [];
-      
-      taskIdIndex.openCursor(IDBKeyRange.only(taskId)).onsuccess = e => {
-        const cursor = e.target.result;
-        if(cursor){
-          out.push(cursor.value);
-          cursor.continue();
-        } else {
-          res(out);
-        }
-      };
-      tx.onerror = e => rej(e.target.error);
-    });
+    const cached = milestonesCache.get(taskId);
+    if(cached) return cached;
+    const version = milestonesVersion;
+    const out = await read(STORE_MILESTONES, store => store.index('taskId').getAll(IDBKeyRange.only(taskId)));
+    if(channel && version === milestonesVersion) milestonesCache.set(taskId, out);
+    return out;
   }
 
-  async function deleteMilestone(id){
-    const conn = await open();
-    return new Promise((res,rej)=>{
-      const tx = conn.transaction([STORE_MILESTONES],'readwrite');
+  // Loads every milestone at once, instead of one query per task
+  function getAllMilestones(){
+    return read(STORE_MILESTONES, store => store.getAll());
+  }
+
+  // Checks via the parentId index whether any milestone has the given milestone as parent
+  async function hasChildMilestones(id){
+    const count = await read(STORE_MILESTONES, store => store.index('parentId').count(IDBKeyRange.only(id)));
+    return count > 0;
+  }
+
+  // Checks via the status index whether any milestone uses the given status
+  async function isStatusUsedByMilestones(status){
+    const count = await read(STORE_MILESTONES, store => store.index('status').count(IDBKeyRange.only(status)));
+    return count > 0;
+  }
+
+  function deleteMilestone(id){
+    return write([STORE_MILESTONES], tx => {
+      invalidateMilestones();
       tx.objectStore(STORE_MILESTONES).delete(id);
-      tx.oncomplete = ()=>res();
-      tx.onerror = e => rej(e.target.error);
     });
   }
 
@@ -187,8 +281,10 @@ export const DB = (function(){
       db.close();
       db = null; // Clear the reference
     }
+    invalidateTasks();
+    invalidateMilestones();
   }
 
-  return {putTask,getTask,deleteTask,getAllTasks,putMeta,getMeta,close,
-          putMilestone, getMilestone, getMilestonesForTask, deleteMilestone};
+  return {putTask,putTasks,getTask,deleteTask,getAllTasks,putMeta,putMetas,getMeta,getMetas,close,
+          putMilestone, putMilestones, getMilestone, getMilestonesForTask, getAllMilestones, hasChildMilestones, isStatusUsedByMilestones, deleteMilestone};
 })();
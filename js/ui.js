@@ -26,15 +26,17 @@ export const UI = (function() {
    */
   async function init() {
     // 1. Load custom options and application settings from DB
-    // Ensure categories is always an array. If DB.getMeta('categories') returns
+    // All settings are read in one transaction rather than one round-trip each.
+    const meta = await DB.getMetas(['categories', 'statuses', 'froms', 'filterSectionVisible', 'selectedFilterCategories']);
+
+    // Ensure categories is always an array. If the stored 'categories' entry is
     // something that's not an array, default to ['General'].
-    const storedCategories = await DB.getMeta('categories');
-    categories = Array.isArray(storedCategories) ? storedCategories : ['General'];
+    categories = Array.isArray(meta.categories) ? meta.categories : ['General'];
 
-    statuses = (await DB.getMeta('statuses')) || ['todo', 'in-progress', 'done'];
-    froms = (await DB.getMeta('froms')) || ['Work', 'Personal', 'Shopping'];
-    filterSectionVisible = (await DB.getMeta('filterSectionVisible')) ?? true;
-    selectedFilterCategories = (await DB.getMeta('selectedFilterCategories')) || [];
+    statuses = meta.statuses || ['todo', 'in-progress', 'done'];
+    froms = meta.froms || ['Work', 'Personal', 'Shopping'];
+    filterSectionVisible = meta.filterSectionVisible ?? true;
+    selectedFilterCategories = meta.selectedFilterCategories || [];
 
     // 2. Prepare initial state object for passing to components
     const commonState = {
@@ -2,6 +2,10 @@
 // This module provides utility functions for common UI operations
 // like HTML escaping and generic modal creation/management.
 
+// Replacement entities for HTML special characters, matched in a single pass
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#039;' };
+const HTML_ESCAPE_RE = /[&<>"']/g;
+
 /**
  * Escapes HTML special characters in a string to prevent XSS.
  * @param {string} unsafe - The string to escape.
@@ -9,7 +13,7 @@
  */
 export function escapeHtml(unsafe) {
   if (!unsafe) return '';
-  return unsafe.replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;").replace(/"/g, "&quot;").replace(/'/g, "&#039;");
+  return unsafe.replace(HTML_ESCAPE_RE, ch => HTML_ESCAPES[ch]);
 }
 
 /**